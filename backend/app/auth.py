@@ -1,9 +1,10 @@
 import os
+import hmac
 import logging
 import bcrypt
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
 from typing import Optional
@@ -20,6 +21,9 @@ if SECRET_KEY == "dev-secret-key-do-not-use-in-production":
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 
+# Admin endpoints are disabled unless ADMIN_API_KEY is set to a non-empty value
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY")
+
 security = HTTPBearer()
 
 
@@ -86,3 +90,14 @@ async def get_current_user(
         raise credentials_exception
 
     return user, account
+
+
+def require_admin(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """Dependency that checks the X-Admin-Key header against ADMIN_API_KEY."""
+    if not ADMIN_API_KEY or not x_admin_key or not hmac.compare_digest(
+        x_admin_key.encode(), ADMIN_API_KEY.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "FORBIDDEN", "message": "Admin access required"}
+        )
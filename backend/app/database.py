@@ -1,14 +1,47 @@
+from sqlalchemy import Engine, inspect, text
 from sqlmodel import SQLModel, Session, create_engine
 from typing import Generator
 
+from app.models import LimitPolicyVersion
+
 DATABASE_URL = "sqlite:///./atm.db"
 
 engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
 
+# Nullable columns added to existing tables after their first release.
+# create_all() never alters existing tables, so these are added at startup if missing.
+ADDED_COLUMNS = {
+    "account": ["limit_tier"],
+}
+
+
+def add_missing_columns(db_engine: Engine) -> None:
+    """Add columns from ADDED_COLUMNS that an older database does not have yet."""
+    inspector = inspect(db_engine)
+    with db_engine.begin() as conn:
+        for table_name, column_names in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            table = SQLModel.metadata.tables[table_name]
+            for name in column_names:
+                if name in existing:
+                    continue
+                column_type = table.c[name].type.compile(dialect=db_engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}"))
+
+
+def seed_policy_version(db_engine: Engine) -> None:
+    """Create the single policy version row, so concurrent admin updates never race to insert it."""
+    with Session(db_engine) as session:
+        if session.get(LimitPolicyVersion, 1) is None:
+            session.add(LimitPolicyVersion(id=1, version=0))
+            session.commit()
+
 
 def create_db_and_tables():
     """Create all database tables."""
     SQLModel.metadata.create_all(engine)
+    add_missing_columns(engine)
+    seed_policy_version(engine)
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlmodel import Session, select
+
+from app.models import Account, LimitPolicy, LimitPolicyVersion
+
+# Default limits, used when no policy matches an account
+DAILY_LIMIT_CENTS = 50000  # $500
+MIN_WITHDRAWAL_CENTS = 2000  # $20
+WITHDRAWAL_INCREMENT_CENTS = 2000  # $20
+
+# Cache configuration
+POLICY_CACHE_TTL_SECONDS = float(os.getenv("LIMIT_POLICY_CACHE_TTL_SECONDS", "30"))
+POLICY_CACHE_MAX_ENTRIES = int(os.getenv("LIMIT_POLICY_CACHE_MAX_ENTRIES", "1024"))
+
+
+@dataclass(frozen=True)
+class WithdrawalLimits:
+    """Resolved withdrawal limits for an account."""
+    daily_limit_cents: int
+    min_withdrawal_cents: int
+    withdrawal_increment_cents: int
+
+
+DEFAULT_LIMITS = WithdrawalLimits(
+    daily_limit_cents=DAILY_LIMIT_CENTS,
+    min_withdrawal_cents=MIN_WITHDRAWAL_CENTS,
+    withdrawal_increment_cents=WITHDRAWAL_INCREMENT_CENTS,
+)
+
+
+def load_limits(session: Session, account: Account) -> WithdrawalLimits:
+    """Resolve limits from the database: account policy, then tier policy, then defaults."""
+    policy = session.exec(
+        select(LimitPolicy).where(LimitPolicy.account_id == account.id)
+    ).first()
+    if policy is None and account.limit_tier is not None:
+        policy = session.exec(
+            select(LimitPolicy).where(LimitPolicy.tier == account.limit_tier)
+        ).first()
+    if policy is None:
+        return DEFAULT_LIMITS
+
+    return WithdrawalLimits(
+        daily_limit_cents=policy.daily_limit_cents,
+        min_withdrawal_cents=policy.min_withdrawal_cents,
+        withdrawal_increment_cents=policy.withdrawal_increment_cents,
+    )
+
+
+def get_policy_version(session: Session) -> int:
+    """Return the current shared policy version (0 if never bumped)."""
+    row = session.get(LimitPolicyVersion, 1)
+    return row.version if row is not None else 0
+
+
+def bump_policy_version(session: Session) -> int:
+    """Increment the shared policy version. Caller is responsible for committing."""
+    row = session.get(LimitPolicyVersion, 1)
+    if row is None:
+        row = LimitPolicyVersion(id=1, version=0)
+    row.version += 1
+    session.add(row)
+    return row.version
+
+
+class LimitPolicyCache:
+    """
+    Bounded LRU cache of resolved limits, keyed by account id.
+
+    Entries expire after `ttl` seconds. The shared policy version is only
+    checked once per `ttl`, so a cache hit costs no database query; when
+    another worker has bumped the version, the whole cache is dropped.
+    """
+
+    def __init__(self, ttl: float = POLICY_CACHE_TTL_SECONDS, max_entries: int = POLICY_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[Optional[str], WithdrawalLimits, float]] = OrderedDict()
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._generation = 0  # Bumped whenever entries are dropped
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, account: Account) -> WithdrawalLimits:
+        now = time.monotonic()
+        self._sync_version(session, now)
+
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(account.id)
+            if entry is not None:
+                tier, limits, expires_at = entry
+                if tier == account.limit_tier and now < expires_at:
+                    self._entries.move_to_end(account.id)
+                    return limits
+                del self._entries[account.id]
+
+        limits = load_limits(session, account)
+
+        with self._lock:
+            # Don't cache limits read before an invalidation that happened during the load
+            if generation != self._generation:
+                return limits
+            self._entries[account.id] = (account.limit_tier, limits, now + self.ttl)
+            self._entries.move_to_end(account.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return limits
+
+    def invalidate(self, version: Optional[int] = None) -> None:
+        """Drop all cached entries, optionally recording the new known version."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._version = version
+            self._version_checked_at = time.monotonic() if version is not None else 0.0
+
+    def _sync_version(self, session: Session, now: float) -> None:
+        if self._version is not None and now - self._version_checked_at < self.ttl:
+            return
+        version = get_policy_version(session)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._generation += 1
+                self._version = version
+            self._version_checked_at = now
+
+
+policy_cache = LimitPolicyCache()
+
+
+def get_withdrawal_limits(session: Session, account: Account) -> WithdrawalLimits:
+    """Resolve limits for an account through the in-process policy cache."""
+    return policy_cache.get(session, account)
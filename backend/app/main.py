@@ -7,7 +7,8 @@ from sqlmodel import Session, select
 from app.database import create_db_and_tables, engine
 from app.models import User, Account
 from app.auth import hash_pin
-from app.routes import auth, account
+from app.velocity import velocity_checker
+from app.routes import auth, account, admin
 
 logger = logging.getLogger(__name__)
 
@@ -68,8 +69,11 @@ def reset_demo_accounts():
                     account_obj.last_withdrawal_date = None
                     session.add(account_obj)
 
+                    # Only the demo accounts' velocity windows; other accounts and terminals keep theirs
+                    velocity_checker.reset_account(account_obj.id)
+
         session.commit()
-        logger.info("Demo accounts reset successfully")
+    logger.info("Demo accounts reset successfully")
 
 
 @asynccontextmanager
@@ -95,12 +99,13 @@ app.add_middleware(
     allow_origins=["http://localhost:5173", "http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization"],
+    allow_headers=["Content-Type", "Authorization", "X-Terminal-Id"],
 )
 
 # Include routers
 app.include_router(auth.router)
 app.include_router(account.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -120,6 +125,7 @@ def debug_reset():
     Resets:
     - Account 1234567890: $1,000 balance, $0 withdrawn today
     - Account 0987654321: $500 balance, $0 withdrawn today
+    - Velocity counters for these two accounts
     """
     reset_demo_accounts()
     return {
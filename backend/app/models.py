@@ -17,3 +17,20 @@ class Account(SQLModel, table=True):
     balance_cents: int = Field(default=0)
     daily_withdrawn_cents: int = Field(default=0)
     last_withdrawal_date: Optional[date] = Field(default=None)
+    limit_tier: Optional[str] = Field(default=None)
+
+
+class LimitPolicy(SQLModel, table=True):
+    """Withdrawal limit policy for a single account or an account tier."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    account_id: Optional[int] = Field(default=None, foreign_key="account.id", unique=True, index=True)
+    tier: Optional[str] = Field(default=None, unique=True, index=True)
+    daily_limit_cents: int
+    min_withdrawal_cents: int
+    withdrawal_increment_cents: int
+
+
+class LimitPolicyVersion(SQLModel, table=True):
+    """Single-row counter bumped whenever limit policies change."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    version: int = Field(default=0)
@@ -1,5 +1,7 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from sqlmodel import Session, select
 from pydantic import BaseModel
 from datetime import timezone, datetime
@@ -7,21 +9,20 @@ from datetime import timezone, datetime
 from app.database import get_session
 from app.models import User, Account
 from app.auth import get_current_user
+from app.limits import get_withdrawal_limits
+from app.velocity import velocity_checker
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/account", tags=["account"])
 
-# Constants
-DAILY_LIMIT_CENTS = 50000  # $500
-MIN_WITHDRAWAL_CENTS = 2000  # $20
-WITHDRAWAL_INCREMENT_CENTS = 2000  # $20
-
 
 class BalanceResponse(BaseModel):
     balance: int
     daily_limit: int
     daily_withdrawn: int
+    min_withdrawal: int
+    withdrawal_increment: int
 
 
 class WithdrawRequest(BaseModel):
@@ -55,8 +56,9 @@ def get_balance(
     user_account: tuple[User, Account] = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """Get current account balance and daily limit info."""
+    """Get current account balance and withdrawal limit info."""
     user, account = user_account
+    limits = get_withdrawal_limits(session, account)
 
     # Reset daily limit if new day
     reset_daily_limit_if_needed(account)
@@ -66,8 +68,10 @@ def get_balance(
 
     return BalanceResponse(
         balance=account.balance_cents,
-        daily_limit=DAILY_LIMIT_CENTS,
-        daily_withdrawn=account.daily_withdrawn_cents
+        daily_limit=limits.daily_limit_cents,
+        daily_withdrawn=account.daily_withdrawn_cents,
+        min_withdrawal=limits.min_withdrawal_cents,
+        withdrawal_increment=limits.withdrawal_increment_cents
     )
 
 
@@ -75,23 +79,28 @@ def get_balance(
 def withdraw(
     request: WithdrawRequest,
     user_account: tuple[User, Account] = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: Session = Depends(get_session),
+    x_terminal_id: Optional[str] = Header(default=None)
 ):
     """Withdraw funds from account."""
     user, account = user_account
     amount = request.amount
+    limits = get_withdrawal_limits(session, account)
 
     # Basic validation (can be done before locking)
-    if amount < MIN_WITHDRAWAL_CENTS:
+    if amount < limits.min_withdrawal_cents:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "INVALID_AMOUNT", "message": f"Minimum withdrawal is ${MIN_WITHDRAWAL_CENTS // 100}"}
+            detail={"code": "INVALID_AMOUNT", "message": f"Minimum withdrawal is ${limits.min_withdrawal_cents // 100}"}
         )
 
-    if amount % WITHDRAWAL_INCREMENT_CENTS != 0:
+    if amount % limits.withdrawal_increment_cents != 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "INVALID_AMOUNT", "message": "Withdrawal must be in multiples of $20"}
+            detail={
+                "code": "INVALID_AMOUNT",
+                "message": f"Withdrawal must be in multiples of ${limits.withdrawal_increment_cents // 100}"
+            }
         )
 
     try:
@@ -117,8 +126,8 @@ def withdraw(
             )
 
         # Check daily limit with latest data
-        if locked_account.daily_withdrawn_cents + amount > DAILY_LIMIT_CENTS:
-            remaining = DAILY_LIMIT_CENTS - locked_account.daily_withdrawn_cents
+        if locked_account.daily_withdrawn_cents + amount > limits.daily_limit_cents:
+            remaining = limits.daily_limit_cents - locked_account.daily_withdrawn_cents
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -127,13 +136,27 @@ def withdraw(
                 }
             )
 
+        # Velocity check: reserve this withdrawal in the sliding windows, released below if the commit fails
+        now = time.monotonic()
+        rejection = velocity_checker.check_and_record(locked_account.id, x_terminal_id, amount, now)
+        if rejection is not None:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail={"code": "VELOCITY_LIMIT_EXCEEDED", "message": rejection}
+            )
+
         # Perform withdrawal
         locked_account.balance_cents -= amount
         locked_account.daily_withdrawn_cents += amount
         locked_account.last_withdrawal_date = datetime.now(timezone.utc).date()
 
         session.add(locked_account)
-        session.commit()
+        try:
+            session.commit()
+        except Exception:
+            # The withdrawal did not happen, so give back its velocity slot
+            velocity_checker.release(locked_account.id, x_terminal_id, amount, now)
+            raise
         session.refresh(locked_account)
 
         return WithdrawResponse(new_balance=locked_account.balance_cents, withdrawn=amount)
@@ -0,0 +1,128 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from pydantic import BaseModel
+
+from app.database import get_session
+from app.models import User, Account, LimitPolicy
+from app.auth import require_admin
+from app.limits import bump_policy_version, policy_cache
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+class LimitPolicyRequest(BaseModel):
+    account_number: Optional[str] = None
+    tier: Optional[str] = None
+    daily_limit: int  # in cents
+    min_withdrawal: int  # in cents
+    withdrawal_increment: int  # in cents
+
+
+class LimitPolicyResponse(BaseModel):
+    account_number: Optional[str]
+    tier: Optional[str]
+    daily_limit: int
+    min_withdrawal: int
+    withdrawal_increment: int
+    version: int
+
+
+class AccountTierRequest(BaseModel):
+    account_number: str
+    tier: Optional[str] = None
+
+
+class AccountTierResponse(BaseModel):
+    account_number: str
+    tier: Optional[str]
+
+
+def get_account_by_number(session: Session, account_number: str) -> Account:
+    """Look up an account by its account number or raise 404."""
+    account = session.exec(
+        select(Account).join(User, Account.user_id == User.id).where(User.account_number == account_number)
+    ).first()
+    if account is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "ACCOUNT_NOT_FOUND", "message": "Account not found"}
+        )
+    return account
+
+
+@router.post("/limit-policies", response_model=LimitPolicyResponse)
+def upsert_limit_policy(request: LimitPolicyRequest, session: Session = Depends(get_session)):
+    """Create or update the limit policy for an account or a tier, and invalidate policy caches."""
+    if (request.account_number is None) == (request.tier is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_POLICY", "message": "Specify exactly one of account_number or tier"}
+        )
+
+    if request.min_withdrawal <= 0 or request.withdrawal_increment <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_POLICY", "message": "Minimum withdrawal and increment must be positive"}
+        )
+
+    if request.daily_limit % 100 or request.min_withdrawal % 100 or request.withdrawal_increment % 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_POLICY", "message": "Limits must be whole dollar amounts"}
+        )
+
+    if request.daily_limit < request.min_withdrawal:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_POLICY", "message": "Daily limit must be at least the minimum withdrawal"}
+        )
+
+    if request.account_number is not None:
+        account = get_account_by_number(session, request.account_number)
+        policy = session.exec(select(LimitPolicy).where(LimitPolicy.account_id == account.id)).first()
+        if policy is None:
+            policy = LimitPolicy(account_id=account.id)
+    else:
+        policy = session.exec(select(LimitPolicy).where(LimitPolicy.tier == request.tier)).first()
+        if policy is None:
+            policy = LimitPolicy(tier=request.tier)
+
+    policy.daily_limit_cents = request.daily_limit
+    policy.min_withdrawal_cents = request.min_withdrawal
+    policy.withdrawal_increment_cents = request.withdrawal_increment
+    session.add(policy)
+
+    # Other workers see the new version on their next version check (at most one TTL later)
+    version = bump_policy_version(session)
+    try:
+        session.commit()
+    except IntegrityError:
+        # A concurrent update created the same policy (or the version row) first
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"code": "POLICY_CONFLICT", "message": "Policy was updated concurrently, please retry"}
+        )
+    policy_cache.invalidate(version)
+
+    return LimitPolicyResponse(
+        account_number=request.account_number,
+        tier=request.tier,
+        daily_limit=policy.daily_limit_cents,
+        min_withdrawal=policy.min_withdrawal_cents,
+        withdrawal_increment=policy.withdrawal_increment_cents,
+        version=version
+    )
+
+
+@router.post("/account-tier", response_model=AccountTierResponse)
+def set_account_tier(request: AccountTierRequest, session: Session = Depends(get_session)):
+    """Assign an account to a limit tier (or clear it with tier=null)."""
+    account = get_account_by_number(session, request.account_number)
+    account.limit_tier = request.tier
+    session.add(account)
+    session.commit()
+
+    return AccountTierResponse(account_number=request.account_number, tier=request.tier)
@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sliding window configuration
+VELOCITY_WINDOW_SECONDS = 600  # 10 minutes
+VELOCITY_BUCKETS = 60  # 10 second resolution
+VELOCITY_MAX_KEYS = 10000
+
+# Per-account limits within the window
+ACCOUNT_MAX_WITHDRAWALS = 5
+ACCOUNT_MAX_AMOUNT_CENTS = 100000  # $1000
+
+# Per-terminal limits within the window (across all accounts)
+TERMINAL_MAX_WITHDRAWALS = 20
+TERMINAL_MAX_AMOUNT_CENTS = 200000  # $2000
+
+
+class _Window:
+    """Ring buffer of per-bucket counts and sums with running totals."""
+    __slots__ = ("counts", "sums", "epoch", "count", "total")
+
+    def __init__(self, buckets: int, epoch: int):
+        self.counts = [0] * buckets
+        self.sums = [0] * buckets
+        self.epoch = epoch  # Bucket number of the newest bucket
+        self.count = 0
+        self.total = 0
+
+
+class SlidingWindowCounter:
+    """
+    Bucketed sliding-window count and sum per key.
+
+    Each key owns a fixed ring of buckets. Advancing the window clears only the
+    buckets that expired since the last update, so updates are amortised O(1).
+    Once `max_keys` is reached, keys whose windows hold no events are evicted,
+    least recently updated first. Keys with live events are never evicted, so a
+    flood of new keys cannot reset an existing key's budget; if every tracked key
+    is still live, the new key is not tracked.
+    """
+
+    def __init__(self, window_seconds: float, buckets: int, max_keys: int = VELOCITY_MAX_KEYS):
+        self.buckets = buckets
+        self.bucket_seconds = window_seconds / buckets
+        self.max_keys = max_keys
+        self._windows: OrderedDict[Hashable, _Window] = OrderedDict()
+
+    def _bucket(self, now: float) -> int:
+        return int(now // self.bucket_seconds)
+
+    def _advance(self, window: _Window, bucket: int) -> None:
+        elapsed = bucket - window.epoch
+        if elapsed <= 0:
+            return
+        if elapsed >= self.buckets:
+            window.counts = [0] * self.buckets
+            window.sums = [0] * self.buckets
+            window.count = 0
+            window.total = 0
+        else:
+            for b in range(window.epoch + 1, bucket + 1):
+                i = b % self.buckets
+                window.count -= window.counts[i]
+                window.total -= window.sums[i]
+                window.counts[i] = 0
+                window.sums[i] = 0
+        window.epoch = bucket
+
+    def totals(self, key: Hashable, now: float) -> tuple[int, int]:
+        """Return (count, sum) recorded for `key` within the window ending at `now`."""
+        window = self._windows.get(key)
+        if window is None:
+            return 0, 0
+        self._advance(window, self._bucket(now))
+        return window.count, window.total
+
+    def _evict_expired(self, bucket: int) -> None:
+        """Drop empty windows from the least recently updated end."""
+        while self._windows:
+            key, window = next(iter(self._windows.items()))
+            self._advance(window, bucket)
+            if window.count:
+                return
+            del self._windows[key]
+
+    def add(self, key: Hashable, amount: int, now: float) -> bool:
+        """Record one event of `amount` for `key` at time `now`. Returns False if the key could not be tracked."""
+        bucket = self._bucket(now)
+        window = self._windows.get(key)
+        if window is None:
+            if len(self._windows) >= self.max_keys:
+                self._evict_expired(bucket)
+                if len(self._windows) >= self.max_keys:
+                    return False
+            window = _Window(self.buckets, bucket)
+            self._windows[key] = window
+        else:
+            self._windows.move_to_end(key)
+            self._advance(window, bucket)
+        i = bucket % self.buckets
+        window.counts[i] += 1
+        window.sums[i] += amount
+        window.count += 1
+        window.total += amount
+        return True
+
+    def remove(self, key: Hashable, amount: int, now: float) -> None:
+        """Undo an event previously added at time `now`, if it is still inside the window."""
+        window = self._windows.get(key)
+        if window is None:
+            return
+        bucket = self._bucket(now)
+        if bucket <= window.epoch - self.buckets:
+            return
+        i = bucket % self.buckets
+        if window.counts[i] == 0:
+            return
+        window.counts[i] -= 1
+        window.sums[i] -= amount
+        window.count -= 1
+        window.total -= amount
+
+    def discard(self, key: Hashable) -> None:
+        """Forget all events for `key`."""
+        self._windows.pop(key, None)
+
+    def clear(self) -> None:
+        self._windows.clear()
+
+
+class VelocityChecker:
+    """Sliding-window withdrawal velocity limits per account and per terminal."""
+
+    def __init__(self, window_seconds: float = VELOCITY_WINDOW_SECONDS, buckets: int = VELOCITY_BUCKETS):
+        self.accounts = SlidingWindowCounter(window_seconds, buckets)
+        self.terminals = SlidingWindowCounter(window_seconds, buckets)
+        self._lock = threading.Lock()
+
+    def check_and_record(
+        self, account_id: int, terminal_id: Optional[str], amount: int, now: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Record a withdrawal if it stays within velocity limits.
+
+        Returns None when accepted, or a rejection message (nothing is recorded).
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self._lock:
+            count, total = self.accounts.totals(account_id, now)
+            if count + 1 > ACCOUNT_MAX_WITHDRAWALS or total + amount > ACCOUNT_MAX_AMOUNT_CENTS:
+                return "Too many withdrawals from this account. Please try again later"
+
+            if terminal_id is not None:
+                count, total = self.terminals.totals(terminal_id, now)
+                if count + 1 > TERMINAL_MAX_WITHDRAWALS or total + amount > TERMINAL_MAX_AMOUNT_CENTS:
+                    return "Too many withdrawals from this terminal. Please try again later"
+                if not self.terminals.add(terminal_id, amount, now):
+                    logger.warning("Velocity terminal table full; not tracking terminal %s", terminal_id)
+
+            if not self.accounts.add(account_id, amount, now):
+                logger.warning("Velocity account table full; not tracking account %s", account_id)
+            return None
+
+    def release(self, account_id: int, terminal_id: Optional[str], amount: int, now: float) -> None:
+        """Undo a recorded withdrawal that did not go through."""
+        with self._lock:
+            self.accounts.remove(account_id, amount, now)
+            if terminal_id is not None:
+                self.terminals.remove(terminal_id, amount, now)
+
+    def reset_account(self, account_id: int) -> None:
+        """Clear one account's window; terminal windows are left alone."""
+        with self._lock:
+            self.accounts.discard(account_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.accounts.clear()
+            self.terminals.clear()
+
+
+velocity_checker = VelocityChecker()
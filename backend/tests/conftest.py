@@ -7,6 +7,25 @@ from app.main import app
 from app.database import get_session
 from app.models import User, Account
 from app.auth import hash_pin
+from app.limits import policy_cache
+from app.velocity import velocity_checker
+from app import auth
+
+
+@pytest.fixture(autouse=True)
+def clear_policy_cache():
+    """Each test gets a fresh database, so drop limits cached by earlier tests."""
+    policy_cache.invalidate()
+    yield
+    policy_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def clear_velocity_counters():
+    """Velocity counters are process-wide; start each test with empty windows."""
+    velocity_checker.clear()
+    yield
+    velocity_checker.clear()
 
 
 @pytest.fixture(name="session")
@@ -30,6 +49,16 @@ def session_fixture():
         session.add(account)
         session.commit()
 
+        # Second user, for checks that span accounts
+        other_user = User(account_number="0987654321", pin_hash=hash_pin("4321"))
+        session.add(other_user)
+        session.commit()
+        session.refresh(other_user)
+
+        other_account = Account(user_id=other_user.id, balance_cents=50000)  # $500
+        session.add(other_account)
+        session.commit()
+
         yield session
 
 
@@ -54,3 +83,21 @@ def auth_headers_fixture(client: TestClient):
     )
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(name="other_auth_headers")
+def other_auth_headers_fixture(client: TestClient):
+    """Get authentication headers for the second seeded user."""
+    response = client.post(
+        "/auth/login",
+        json={"account_number": "0987654321", "pin": "4321"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(name="admin_headers")
+def admin_headers_fixture(monkeypatch):
+    """Enable admin endpoints and return headers carrying the admin key."""
+    monkeypatch.setattr(auth, "ADMIN_API_KEY", "test-admin-key")
+    return {"X-Admin-Key": "test-admin-key"}
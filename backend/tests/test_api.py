@@ -1,4 +1,11 @@
+import time
+from unittest.mock import patch
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+from app import auth
+from app.velocity import velocity_checker
 
 
 class TestAuth:
@@ -45,6 +52,8 @@ class TestBalance:
         assert data["balance"] == 100000  # $1000 in cents
         assert data["daily_limit"] == 50000  # $500 in cents
         assert data["daily_withdrawn"] == 0
+        assert data["min_withdrawal"] == 2000  # $20 in cents
+        assert data["withdrawal_increment"] == 2000  # $20 in cents
 
     def test_balance_unauthorized(self, client: TestClient):
         """Test balance endpoint requires authentication."""
@@ -132,3 +141,208 @@ class TestDeposit:
         )
         assert response.status_code == 400
         assert response.json()["detail"]["code"] == "INVALID_AMOUNT"
+
+
+class TestLimitPolicies:
+    """Tests for per-account and per-tier withdrawal limit policies."""
+
+    def test_admin_requires_key(self, client: TestClient):
+        """Test admin endpoints reject requests without the admin key."""
+        response = client.post(
+            "/admin/limit-policies",
+            json={"tier": "premium", "daily_limit": 100000, "min_withdrawal": 2000, "withdrawal_increment": 2000}
+        )
+        assert response.status_code == 403
+        assert response.json()["detail"]["code"] == "FORBIDDEN"
+
+    def test_admin_disabled_with_empty_key(self, client: TestClient, monkeypatch):
+        """Test an empty configured admin key keeps admin endpoints closed."""
+        monkeypatch.setattr(auth, "ADMIN_API_KEY", "")
+        response = client.post(
+            "/admin/account-tier",
+            json={"account_number": "1234567890", "tier": "premium"},
+            headers={"X-Admin-Key": ""}
+        )
+        assert response.status_code == 403
+
+    def test_admin_rejects_non_ascii_key(self, client: TestClient, admin_headers: dict):
+        """Test a non-ASCII admin key is rejected rather than erroring."""
+        response = client.post(
+            "/admin/limit-policies",
+            json={"tier": "premium", "daily_limit": 100000, "min_withdrawal": 2000, "withdrawal_increment": 2000},
+            headers={"X-Admin-Key": b"test-admin-key\xe9"}
+        )
+        assert response.status_code == 403
+
+    def test_account_policy_applies_to_balance_and_withdraw(
+        self, client: TestClient, auth_headers: dict, admin_headers: dict
+    ):
+        """Test an account policy overrides the default limits, even after they were cached."""
+        # Populate the cache with the default limits first
+        assert client.get("/account/balance", headers=auth_headers).json()["daily_limit"] == 50000
+
+        response = client.post(
+            "/admin/limit-policies",
+            json={
+                "account_number": "1234567890",
+                "daily_limit": 80000,
+                "min_withdrawal": 5000,
+                "withdrawal_increment": 5000
+            },
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        data = client.get("/account/balance", headers=auth_headers).json()
+        assert data["daily_limit"] == 80000
+        assert data["min_withdrawal"] == 5000
+        assert data["withdrawal_increment"] == 5000
+
+        response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_AMOUNT"
+
+        response = client.post("/account/withdraw", json={"amount": 60000}, headers=auth_headers)
+        assert response.status_code == 200
+
+    def test_tier_policy(self, client: TestClient, auth_headers: dict, admin_headers: dict):
+        """Test accounts assigned to a tier use that tier's policy."""
+        client.post(
+            "/admin/limit-policies",
+            json={"tier": "premium", "daily_limit": 100000, "min_withdrawal": 2000, "withdrawal_increment": 2000},
+            headers=admin_headers
+        )
+        response = client.post(
+            "/admin/account-tier",
+            json={"account_number": "1234567890", "tier": "premium"},
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        assert client.get("/account/balance", headers=auth_headers).json()["daily_limit"] == 100000
+
+    def test_policy_requires_whole_dollars(self, client: TestClient, admin_headers: dict):
+        """Test policy amounts must be whole dollars so error messages stay exact."""
+        response = client.post(
+            "/admin/limit-policies",
+            json={"tier": "premium", "daily_limit": 100000, "min_withdrawal": 2550, "withdrawal_increment": 50},
+            headers=admin_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_POLICY"
+
+    def test_concurrent_policy_insert_returns_conflict(
+        self, client: TestClient, admin_headers: dict, session: Session
+    ):
+        """Test losing a race to create the same policy returns a structured 409."""
+        error = IntegrityError("INSERT INTO limitpolicy", {}, Exception("UNIQUE constraint failed: limitpolicy.tier"))
+        with patch.object(session, "commit", side_effect=error):
+            response = client.post(
+                "/admin/limit-policies",
+                json={"tier": "premium", "daily_limit": 100000, "min_withdrawal": 2000, "withdrawal_increment": 2000},
+                headers=admin_headers
+            )
+        assert response.status_code == 409
+        assert response.json()["detail"]["code"] == "POLICY_CONFLICT"
+
+    def test_policy_requires_single_target(self, client: TestClient, admin_headers: dict):
+        """Test a policy must target exactly one of account or tier."""
+        response = client.post(
+            "/admin/limit-policies",
+            json={"daily_limit": 100000, "min_withdrawal": 2000, "withdrawal_increment": 2000},
+            headers=admin_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_POLICY"
+
+
+class TestVelocity:
+    """Tests for withdrawal velocity checks."""
+
+    def test_account_burst_rejected(self, client: TestClient, auth_headers: dict):
+        """Test too many withdrawals from one account within the window are rejected."""
+        for _ in range(5):
+            response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+            assert response.status_code == 200
+
+        response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 429
+        assert response.json()["detail"]["code"] == "VELOCITY_LIMIT_EXCEEDED"
+
+        # Rejected withdrawal did not touch the balance
+        assert client.get("/account/balance", headers=auth_headers).json()["balance"] == 90000
+
+    def test_failed_withdrawal_not_counted(self, client: TestClient, auth_headers: dict):
+        """Test withdrawals rejected for other reasons do not use up the velocity budget."""
+        for _ in range(5):
+            response = client.post("/account/withdraw", json={"amount": 200000}, headers=auth_headers)
+            assert response.json()["detail"]["code"] == "INSUFFICIENT_FUNDS"
+
+        response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 200
+
+    def test_failed_commit_releases_slot(self, client: TestClient, auth_headers: dict, session: Session):
+        """Test a withdrawal whose commit fails is removed from the velocity totals."""
+        with patch.object(session, "commit", side_effect=RuntimeError("database is locked")):
+            response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 500
+        assert velocity_checker.accounts.totals(1, time.monotonic()) == (0, 0)
+
+    def test_failure_after_commit_keeps_slot(self, client: TestClient, auth_headers: dict, session: Session):
+        """Test a committed withdrawal stays counted even if a later step fails."""
+        with patch.object(session, "refresh", side_effect=RuntimeError("connection lost")):
+            response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 500
+        assert velocity_checker.accounts.totals(1, time.monotonic()) == (1, 2000)
+
+    def test_no_terminal_id_skips_terminal_check(self, client: TestClient, auth_headers: dict):
+        """Test withdrawals without X-Terminal-Id are not pooled under a shared proxy address."""
+        with patch("app.velocity.TERMINAL_MAX_WITHDRAWALS", 0):
+            response = client.post("/account/withdraw", json={"amount": 2000}, headers=auth_headers)
+        assert response.status_code == 200
+        assert velocity_checker.terminals._windows == {}
+
+    def test_terminal_burst_across_accounts_rejected(
+        self, client: TestClient, auth_headers: dict, other_auth_headers: dict
+    ):
+        """Test withdrawals from several accounts add up against one terminal's limit."""
+        first = {**auth_headers, "X-Terminal-Id": "atm-1"}
+        second = {**other_auth_headers, "X-Terminal-Id": "atm-1"}
+
+        # Each account stays under its own limit of 5; together they reach the terminal limit of 6
+        with patch("app.velocity.TERMINAL_MAX_WITHDRAWALS", 6):
+            for headers in (first, second, first, second, first, second):
+                assert client.post("/account/withdraw", json={"amount": 2000}, headers=headers).status_code == 200
+
+            response = client.post("/account/withdraw", json={"amount": 2000}, headers=second)
+            assert response.status_code == 429
+            assert response.json()["detail"]["code"] == "VELOCITY_LIMIT_EXCEEDED"
+            assert "terminal" in response.json()["detail"]["message"]
+
+            # The same account can still withdraw from another terminal
+            response = client.post(
+                "/account/withdraw",
+                json={"amount": 2000},
+                headers={**other_auth_headers, "X-Terminal-Id": "atm-2"}
+            )
+            assert response.status_code == 200
+
+    def test_debug_reset_clears_demo_account_velocity(
+        self, client: TestClient, auth_headers: dict, session: Session
+    ):
+        """Test the demo reset clears only the demo accounts' velocity counters."""
+        headers = {**auth_headers, "X-Terminal-Id": "atm-1"}
+        for _ in range(5):
+            client.post("/account/withdraw", json={"amount": 2000}, headers=headers)
+        velocity_checker.check_and_record(999, None, 2000)  # Some other customer's account
+
+        with patch("app.main.engine", session.get_bind()):
+            assert client.post("/debug/reset").status_code == 200
+
+        now = time.monotonic()
+        assert velocity_checker.accounts.totals(1, now) == (0, 0)
+        assert velocity_checker.accounts.totals(999, now) == (1, 2000)
+        assert velocity_checker.terminals.totals("atm-1", now) == (5, 10000)
+
+        response = client.post("/account/withdraw", json={"amount": 2000}, headers=headers)
+        assert response.status_code == 200
@@ -0,0 +1,53 @@
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel, Session, create_engine, select
+from sqlmodel.pool import StaticPool
+
+from app.database import add_missing_columns, seed_policy_version
+from app.models import Account, LimitPolicyVersion
+
+
+class TestAddMissingColumns:
+    """Tests for the startup column migration."""
+
+    def test_adds_limit_tier_to_baseline_account_table(self):
+        """Test an account table created before limit_tier existed gets the column."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE account (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "balance_cents INTEGER NOT NULL, daily_withdrawn_cents INTEGER NOT NULL, "
+                "last_withdrawal_date DATE)"
+            ))
+            conn.execute(text(
+                "INSERT INTO account (id, user_id, balance_cents, daily_withdrawn_cents) VALUES (1, 1, 100, 0)"
+            ))
+        SQLModel.metadata.create_all(engine)
+
+        add_missing_columns(engine)
+        add_missing_columns(engine)  # Idempotent
+
+        columns = {column["name"] for column in inspect(engine).get_columns("account")}
+        assert "limit_tier" in columns
+        with Session(engine) as session:
+            account = session.exec(select(Account)).one()
+            assert account.limit_tier is None
+
+
+class TestSeedPolicyVersion:
+    """Tests for seeding the policy version row."""
+
+    def test_seeds_once(self):
+        """Test the version row is created once and existing versions are kept."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+
+        seed_policy_version(engine)
+        with Session(engine) as session:
+            row = session.get(LimitPolicyVersion, 1)
+            row.version = 7
+            session.add(row)
+            session.commit()
+
+        seed_policy_version(engine)
+        with Session(engine) as session:
+            assert session.get(LimitPolicyVersion, 1).version == 7
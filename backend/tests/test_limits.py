@@ -0,0 +1,94 @@
+from unittest.mock import patch
+from sqlmodel import Session, select
+
+from app.limits import DEFAULT_LIMITS, LimitPolicyCache, bump_policy_version, load_limits
+from app.models import Account, LimitPolicy
+
+
+def get_account(session: Session) -> Account:
+    return session.exec(select(Account)).first()
+
+
+class TestLimitPolicyCache:
+    """Tests for the in-process limit policy cache."""
+
+    def test_invalidate_during_load_is_not_cached(self, session: Session):
+        """Test limits read before a concurrent invalidation are not written to the cache."""
+        cache = LimitPolicyCache(ttl=60)
+        account = get_account(session)
+
+        def load_then_invalidate(session, account):
+            limits = load_limits(session, account)
+            session.add(LimitPolicy(account_id=account.id, daily_limit_cents=80000,
+                                    min_withdrawal_cents=2000, withdrawal_increment_cents=2000))
+            version = bump_policy_version(session)
+            session.commit()
+            cache.invalidate(version)
+            return limits
+
+        with patch("app.limits.load_limits", side_effect=load_then_invalidate):
+            assert cache.get(session, account) == DEFAULT_LIMITS
+
+        assert cache.get(session, account).daily_limit_cents == 80000
+
+    def test_size_is_bounded(self, session: Session):
+        """Test the least recently used account is dropped past max_entries."""
+        cache = LimitPolicyCache(ttl=60, max_entries=2)
+        accounts = [get_account(session)]
+        for user_id in (2, 3):
+            account = Account(user_id=user_id, balance_cents=0)
+            session.add(account)
+            session.commit()
+            session.refresh(account)
+            accounts.append(account)
+
+        for account in accounts:
+            cache.get(session, account)
+
+        assert list(cache._entries) == [accounts[1].id, accounts[2].id]
+
+    def test_entries_expire_after_ttl(self, session: Session):
+        """Test a cached entry is reloaded once its TTL has passed."""
+        cache = LimitPolicyCache(ttl=0)
+        account = get_account(session)
+        assert cache.get(session, account) == DEFAULT_LIMITS
+
+        # Change the policy without bumping the version; only expiry can pick it up
+        session.add(LimitPolicy(account_id=account.id, daily_limit_cents=80000,
+                                min_withdrawal_cents=2000, withdrawal_increment_cents=2000))
+        session.commit()
+
+        assert cache.get(session, account).daily_limit_cents == 80000
+
+    def test_cache_hit_within_ttl_does_not_query(self, session: Session):
+        """Test a warm cache serves limits without touching the database."""
+        cache = LimitPolicyCache(ttl=60)
+        account = get_account(session)
+        cache.get(session, account)
+
+        with patch("app.limits.load_limits") as load, patch("app.limits.get_policy_version") as version:
+            assert cache.get(session, account) == DEFAULT_LIMITS
+        load.assert_not_called()
+        version.assert_not_called()
+
+    def test_version_bump_from_other_worker_drops_entries(self, session: Session):
+        """Test a version bumped by another worker makes this cache reload after its check interval."""
+        this_worker = LimitPolicyCache(ttl=60)
+        other_worker = LimitPolicyCache(ttl=60)
+        account = get_account(session)
+        assert this_worker.get(session, account) == DEFAULT_LIMITS
+
+        # Admin update handled by the other worker
+        session.add(LimitPolicy(account_id=account.id, daily_limit_cents=80000,
+                                min_withdrawal_cents=2000, withdrawal_increment_cents=2000))
+        version = bump_policy_version(session)
+        session.commit()
+        other_worker.invalidate(version)
+
+        # Still within this worker's check interval: the cached limits are served
+        assert this_worker.get(session, account) == DEFAULT_LIMITS
+
+        # Once the interval elapses, the version check sees the bump and drops the entry,
+        # even though the entry itself has not expired
+        this_worker._version_checked_at -= this_worker.ttl
+        assert this_worker.get(session, account).daily_limit_cents == 80000
@@ -0,0 +1,47 @@
+from app.velocity import SlidingWindowCounter
+
+
+class TestSlidingWindowCounter:
+    """Tests for the bucketed sliding-window counter."""
+
+    def test_counts_and_sums_within_window(self):
+        """Test events inside the window are counted and summed."""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=6)
+        counter.add("a", 2000, now=0)
+        counter.add("a", 4000, now=15)
+        assert counter.totals("a", now=30) == (2, 6000)
+        assert counter.totals("b", now=30) == (0, 0)
+
+    def test_old_buckets_expire(self):
+        """Test events slide out of the window bucket by bucket."""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=6)
+        counter.add("a", 2000, now=0)
+        counter.add("a", 4000, now=30)
+        assert counter.totals("a", now=65) == (1, 4000)
+        assert counter.totals("a", now=500) == (0, 0)
+
+    def test_remove_undoes_add(self):
+        """Test removing an event inside the window restores the totals."""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=6)
+        counter.add("a", 2000, now=10)
+        counter.remove("a", 2000, now=10)
+        assert counter.totals("a", now=20) == (0, 0)
+
+    def test_expired_keys_evicted_when_full(self):
+        """Test a key whose events have all expired makes room for a new key."""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=6, max_keys=2)
+        counter.add("a", 1, now=0)
+        counter.add("b", 1, now=50)
+        assert counter.add("c", 1, now=70)
+        assert list(counter._windows) == ["b", "c"]
+        assert counter.totals("b", now=70) == (1, 1)
+
+    def test_live_keys_not_evicted_when_full(self):
+        """Test new keys cannot push out keys that still have events in the window."""
+        counter = SlidingWindowCounter(window_seconds=60, buckets=6, max_keys=2)
+        counter.add("a", 1, now=0)
+        counter.add("b", 1, now=0)
+        for i in range(100):
+            assert not counter.add(f"spoofed-{i}", 1, now=10)
+        assert counter.totals("a", now=10) == (1, 1)
+        assert counter.totals("b", now=10) == (1, 1)
@@ -12,6 +12,18 @@ import type {
 // Flag to prevent multiple simultaneous logout redirects
 let isLoggingOut = false;
 
+// Stable per-device id used by the backend's per-terminal velocity limits
+const TERMINAL_ID_KEY = 'atm_terminal_id';
+
+function getTerminalId(): string {
+  let terminalId = localStorage.getItem(TERMINAL_ID_KEY);
+  if (!terminalId) {
+    terminalId = crypto.randomUUID();
+    localStorage.setItem(TERMINAL_ID_KEY, terminalId);
+  }
+  return terminalId;
+}
+
 const api = axios.create({
   baseURL: '/api',
   timeout: 30000, // 30 second timeout
@@ -20,12 +32,13 @@ const api = axios.create({
   },
 });
 
-// Add JWT token to requests
+// Add JWT token and terminal id to requests
 api.interceptors.request.use((config) => {
   const token = sessionStorage.getItem('atm_token');
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
+  config.headers['X-Terminal-Id'] = getTerminalId();
   return config;
 });
 
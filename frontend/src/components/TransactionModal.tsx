@@ -1,16 +1,14 @@
 import { useState } from 'react';
 import { getErrorMessage } from '../utils/errorHandling';
 
-// Constants
-const MIN_WITHDRAWAL = 20;
-const WITHDRAWAL_INCREMENT = 20;
-
 interface TransactionModalProps {
   type: 'withdraw' | 'deposit';
   isOpen: boolean;
   onClose: () => void;
   onSubmit: (amount: number) => Promise<void>;
   maxAmount?: number;
+  minWithdrawal?: number; // in cents
+  withdrawalIncrement?: number; // in cents
 }
 
 export function TransactionModal({
@@ -19,6 +17,8 @@ export function TransactionModal({
   onClose,
   onSubmit,
   maxAmount,
+  minWithdrawal,
+  withdrawalIncrement,
 }: TransactionModalProps) {
   const [amount, setAmount] = useState('');
   const [loading, setLoading] = useState(false);
@@ -26,8 +26,15 @@ export function TransactionModal({
 
   if (!isOpen) return null;
 
+  // Per-account limits come from the balance response, in cents
+  const minWithdrawalDollars = minWithdrawal !== undefined ? minWithdrawal / 100 : undefined;
+  const incrementDollars = withdrawalIncrement !== undefined ? withdrawalIncrement / 100 : undefined;
+
   const quickAmounts = type === 'withdraw'
-    ? [20, 40, 60, 100, 200]
+    ? [20, 40, 50, 60, 100, 200].filter((value) =>
+        (minWithdrawalDollars === undefined || value >= minWithdrawalDollars) &&
+        (incrementDollars === undefined || value % incrementDollars === 0)
+      ).slice(0, 5)
     : [50, 100, 200, 500];
 
   const handleSubmit = async () => {
@@ -39,12 +46,12 @@ export function TransactionModal({
     }
 
     if (type === 'withdraw') {
-      if (numAmount < MIN_WITHDRAWAL) {
-        setError(`Minimum withdrawal is $${MIN_WITHDRAWAL}`);
+      if (minWithdrawalDollars !== undefined && numAmount < minWithdrawalDollars) {
+        setError(`Minimum withdrawal is $${minWithdrawalDollars}`);
         return;
       }
-      if (numAmount % WITHDRAWAL_INCREMENT !== 0) {
-        setError(`Amount must be in multiples of $${WITHDRAWAL_INCREMENT}`);
+      if (incrementDollars !== undefined && numAmount % incrementDollars !== 0) {
+        setError(`Amount must be in multiples of $${incrementDollars}`);
         return;
       }
       if (maxAmount && numAmount > maxAmount / 100) {
@@ -106,9 +113,9 @@ export function TransactionModal({
               className="w-full pl-10 pr-4 py-4 text-2xl font-semibold border border-[var(--color-gray-300)] rounded-lg focus:border-[var(--color-primary)] focus:ring-2 focus:ring-[var(--color-primary)]/20 focus:outline-none bg-white text-[var(--color-gray-900)]"
             />
           </div>
-          {type === 'withdraw' && (
+          {type === 'withdraw' && minWithdrawalDollars !== undefined && incrementDollars !== undefined && (
             <p className="text-sm text-[var(--color-gray-500)] mt-1">
-              Minimum ${MIN_WITHDRAWAL}, in multiples of ${WITHDRAWAL_INCREMENT}
+              Minimum ${minWithdrawalDollars}, in multiples of ${incrementDollars}
             </p>
           )}
         </div>
@@ -198,7 +198,13 @@ export function Dashboard() {
               <button
                 key={amount}
                 onClick={() => handleWithdraw(amount * 100)}
-                disabled={!balance || amount * 100 > balance.balance || amount * 100 > (balance.daily_limit - balance.daily_withdrawn)}
+                disabled={
+                  !balance ||
+                  amount * 100 > balance.balance ||
+                  amount * 100 > (balance.daily_limit - balance.daily_withdrawn) ||
+                  amount * 100 < balance.min_withdrawal ||
+                  (amount * 100) % balance.withdrawal_increment !== 0
+                }
                 className="py-3 bg-[var(--color-gray-50)] text-[var(--color-gray-900)] hover:bg-[var(--color-primary)] hover:text-white rounded-lg font-medium transition-colors disabled:opacity-40 disabled:cursor-not-allowed disabled:hover:bg-[var(--color-gray-50)] disabled:hover:text-[var(--color-gray-900)] border border-[var(--color-gray-200)]"
               >
                 ${amount}
@@ -208,10 +214,12 @@ export function Dashboard() {
         </div>
 
         {/* Info */}
-        <div className="text-center text-sm text-[var(--color-gray-500)] pb-6">
-          <p>Daily withdrawal limit: $500</p>
-          <p>Withdrawals must be in multiples of $20</p>
-        </div>
+        {balance && (
+          <div className="text-center text-sm text-[var(--color-gray-500)] pb-6">
+            <p>Daily withdrawal limit: ${balance.daily_limit / 100}</p>
+            <p>Withdrawals must be at least ${balance.min_withdrawal / 100}, in multiples of ${balance.withdrawal_increment / 100}</p>
+          </div>
+        )}
       </main>
 
       {/* Transaction Modals */}
@@ -221,6 +229,8 @@ export function Dashboard() {
         onClose={() => setModalType(null)}
         onSubmit={handleWithdraw}
         maxAmount={balance ? Math.min(balance.balance, balance.daily_limit - balance.daily_withdrawn) : 0}
+        minWithdrawal={balance?.min_withdrawal}
+        withdrawalIncrement={balance?.withdrawal_increment}
       />
 
       <TransactionModal
@@ -12,6 +12,8 @@ export interface BalanceResponse {
   balance: number;
   daily_limit: number;
   daily_withdrawn: number;
+  min_withdrawal: number;
+  withdrawal_increment: number;
 }
 
 export interface WithdrawRequest {